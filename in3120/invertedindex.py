@@ -1,11 +1,13 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-import itertools
 from abc import ABC, abstractmethod
-from collections import Counter
-from typing import Iterable, Iterator, List
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import DefaultDict, Iterable, Iterator, List
 from .dictionary import InMemoryDictionary
+from .document import Document
 from .normalizer import Normalizer
 from .tokenizer import Tokenizer
 from .corpus import Corpus
@@ -58,6 +60,11 @@ class InMemoryInvertedIndex(InvertedIndex):
 
     If index compression is enabled, only the posting lists are compressed. Dictionary
     compression is currently not supported.
+
+    If more than one worker is specified, the corpus is split into shards that are tokenized
+    and normalized in separate processes. This requires that the corpus' documents, the
+    normalizer, and the tokenizer can be pickled. For small corpora the cost of starting up
+    the worker processes outweighs the gains.
     """
 
     def __init__(
@@ -67,25 +74,74 @@ class InMemoryInvertedIndex(InvertedIndex):
         normalizer: Normalizer,
         tokenizer: Tokenizer,
         compressed: bool = False,
+        workers: int = 1,
     ):
         self.__corpus = corpus
         self.__normalizer = normalizer
         self.__tokenizer = tokenizer
         self.__posting_lists: List[PostingList] = []
         self.__dictionary = InMemoryDictionary()
-        self.__build_index(fields, compressed)
+        self.__build_index(fields, compressed, workers)
 
     def __repr__(self):
         return str({term: self.__posting_lists[term_id] for (term, term_id) in self.__dictionary})
 
-    def __build_index(self, fields: Iterable[str], compressed: bool) -> None:
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+    def __build_index(self, fields: Iterable[str], compressed: bool, workers: int) -> None:
+        """
+        Builds the index in a single pass over the corpus, counting term occurrences per document as
+        we go. The posting lists are finalized as they are created, since a compressed posting list
+        might have a partially filled group of numbers left to encode.
+        """
+        fields = list(fields)
+        if workers > 1:
+            documents = list(self.__corpus)
+            size = max(1, -(-len(documents) // workers))
+            shards = [documents[i:i + size] for i in range(0, len(documents), size)]
+            frequencies: DefaultDict[str, Counter] = defaultdict(Counter)
+            with ProcessPoolExecutor(workers) as executor:
+                arguments = (shards, repeat(fields), repeat(self.__normalizer), repeat(self.__tokenizer))
+                for shard_frequencies in executor.map(_count_terms, *arguments):
+                    for (term, counter) in shard_frequencies.items():
+                        frequencies[term].update(counter)
+        else:
+            frequencies = _count_terms(self.__corpus, fields, self.__normalizer, self.__tokenizer)
+        for (term, counter) in frequencies.items():
+            term_id = self.__dictionary.add_if_absent(term)
+            assert term_id == len(self.__posting_lists)
+            posting_list = CompressedInMemoryPostingList() if compressed else InMemoryPostingList()
+            posting_list.append_postings(Posting(document_id, counter[document_id]) for document_id in sorted(counter))
+            posting_list.finalize_postings()
+            self.__posting_lists.append(posting_list)
 
     def get_terms(self, buffer: str) -> Iterator[str]:
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        return _get_terms(buffer, self.__normalizer, self.__tokenizer)
 
     def get_postings_iterator(self, term: str) -> Iterator[Posting]:
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        term_id = self.__dictionary.get_term_id(term)
+        return iter([]) if term_id is None else self.__posting_lists[term_id].get_iterator()
 
     def get_document_frequency(self, term: str) -> int:
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        term_id = self.__dictionary.get_term_id(term)
+        return 0 if term_id is None else self.__posting_lists[term_id].get_length()
+
+
+def _get_terms(buffer: str, normalizer: Normalizer, tokenizer: Tokenizer) -> Iterator[str]:
+    """
+    Processes the given text buffer and returns an iterator that yields normalized terms as
+    they are indexed.
+    """
+    return normalizer.normalize_stream(tokenizer.strings(normalizer.canonicalize(buffer)))
+
+
+def _count_terms(documents: Iterable[Document], fields: List[str], normalizer: Normalizer,
+                 tokenizer: Tokenizer) -> DefaultDict[str, Counter]:
+    """
+    Counts how many times each term occurs in each of the given documents, across the named fields.
+    Defined at module level so that it can be shipped off to worker processes.
+    """
+    frequencies: DefaultDict[str, Counter] = defaultdict(Counter)
+    for document in documents:
+        for field in fields:
+            for term in _get_terms(document.get_field(field, ""), normalizer, tokenizer):
+                frequencies[term][document.document_id] += 1
+    return frequencies
@@ -1,8 +1,10 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import functools
 import unicodedata
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 from .soundex import Soundex
 from .porterstemmer import PorterStemmer
 
@@ -33,6 +35,10 @@ class Normalizer(ABC):
         #
         # Unicode canonicalization is especially important for some languages. E.g., for Chinese,
         # Japanese and Korean we'd want to properly support both full-width and half-width forms.
+        #
+        # Pure ASCII is already in NFKC, and checking for that is a constant-time flag lookup.
+        if buffer.isascii():
+            return buffer
         return unicodedata.normalize("NFKC", buffer)
 
     @abstractmethod
@@ -45,6 +51,14 @@ class Normalizer(ABC):
         """
         pass
 
+    def normalize_stream(self, tokens: Iterable[str]) -> Iterator[str]:
+        """
+        Normalizes a stream of tokens, e.g., all the tokens produced by a tokenizer for a single text
+        buffer. Equivalent to invoking normalize/1 on each token, but subclasses can override this
+        to avoid a Python-level method call per token.
+        """
+        return (self.normalize(token) for token in tokens)
+
 
 class SimpleNormalizer(Normalizer):
     """
@@ -58,6 +72,9 @@ class SimpleNormalizer(Normalizer):
     def normalize(self, token: str) -> str:
         return token.casefold()
 
+    def normalize_stream(self, tokens: Iterable[str]) -> Iterator[str]:
+        return (token.casefold() for token in tokens)
+
 
 class SoundexNormalizer(Normalizer):
     """
@@ -74,10 +91,25 @@ class SoundexNormalizer(Normalizer):
 class PorterNormalizer(Normalizer):
     """
     Applies a set of recall-enhancing stemming heuristics. Assumes English.
+
+    Stemming is costly, and natural language text has a small vocabulary relative to its
+    length. We therefore memoize the stems of the most recently seen tokens.
     """
 
+    # The maximum number of distinct tokens we memoize stems for.
+    __CACHE_SIZE = 1 << 16
+
     def __init__(self):
-        self._stemmer = PorterStemmer()
+        self.__setstate__({"_stemmer": PorterStemmer()})
+
+    def __getstate__(self):
+        # The memoized stems are bound to our stemmer and can't be pickled, e.g., when the normalizer
+        # is shipped to worker processes. They're cheap to rebuild, so we leave them out.
+        return {"_stemmer": self._stemmer}
+
+    def __setstate__(self, state):
+        self._stemmer = state["_stemmer"]
+        self._stem = functools.lru_cache(maxsize=self.__CACHE_SIZE)(self._stemmer.stem)
 
     def normalize(self, token: str) -> str:
-        return self._stemmer.stem(token)
+        return self._stem(token)
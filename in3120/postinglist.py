@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
-from typing import Iterator, List
+from bisect import bisect_right
+from math import isqrt
+from typing import Iterable, Iterator, List, Optional
 from .posting import Posting
 from .variablebytecodec import VariableByteCodec
 
@@ -32,6 +34,14 @@ class PostingList(ABC):
         """
         pass
 
+    def get_skip_iterator(self) -> Optional[Iterator[Posting]]:
+        """
+        Returns an iterator that, in addition to stepping through the posting list, supports skipping
+        ahead to a given document identifier via skip_to/1. Stepping through it one posting at a time
+        might be slower than using get_iterator/0. Returns None if skipping isn't supported.
+        """
+        return None
+
     @abstractmethod
     def append_posting(self, posting: Posting) -> None:
         """
@@ -39,6 +49,14 @@ class PostingList(ABC):
         """
         pass
 
+    def append_postings(self, postings: Iterable[Posting]) -> None:
+        """
+        Appends a batch of postings to the posting list. Equivalent to appending them one at a
+        time, but subclasses can override this to avoid a method call per posting.
+        """
+        for posting in postings:
+            self.append_posting(posting)
+
     @abstractmethod
     def finalize_postings(self) -> None:
         """
@@ -52,10 +70,59 @@ class PostingList(ABC):
 class InMemoryPostingList(PostingList):
     """
     A simple in-memory implementation of a posting list.
+
+    When finalized, the posting list is divided into blocks of roughly sqrt(n) postings each, and
+    we keep a skip pointer to the start of each block. This allows skip iterators to skip ahead
+    over whole blocks, which speeds up selective intersections.
     """
 
+    class InMemoryPostingListIterator(Iterator[Posting]):
+        """
+        A custom iterator that, in addition to stepping through the postings one at a time, can
+        make use of the skip pointers to quickly advance to a given document identifier.
+        """
+
+        def __init__(self, postings: List[Posting], skips: List[int], step: int):
+            self.__postings = postings  # All the postings in the posting list.
+            self.__skips = skips  # The document identifiers at the start of each block.
+            self.__step = step  # The number of postings per block.
+            self.__where = 0  # The position of the next posting to return.
+
+        def __next__(self) -> Posting:
+            try:
+                posting = self.__postings[self.__where]
+            except IndexError:
+                raise StopIteration
+            self.__where += 1
+            return posting
+
+        def __length_hint__(self) -> int:
+            return max(0, len(self.__postings) - self.__where)
+
+        def skip_to(self, document_id: int) -> Optional[Posting]:
+            """
+            Advances past all postings having document identifiers smaller than the given one, and
+            returns the first posting that doesn't, if any. If the given document identifier lies
+            beyond the current block, we use the skip pointers to jump directly to the last block
+            that starts at or before it. We then step forward within that block.
+            """
+            postings, skips, where = self.__postings, self.__skips, self.__where
+            block = where // self.__step + 1
+            if block < len(skips) and skips[block] <= document_id:
+                where = (bisect_right(skips, document_id, block) - 1) * self.__step
+            length = len(postings)
+            while where < length and postings[where].document_id < document_id:
+                where += 1
+            if where < length:
+                self.__where = where + 1
+                return postings[where]
+            self.__where = length
+            return None
+
     def __init__(self):
         self.__postings : List[Posting] = []
+        self.__skips: List[int] = []  # The document identifiers at the start of each block. Set when finalized.
+        self.__step = 1  # The number of postings per block. Set when finalized.
 
     def get_length(self) -> int:
         return len(self.__postings)
@@ -63,12 +130,21 @@ class InMemoryPostingList(PostingList):
     def get_iterator(self) -> Iterator[Posting]:
         return iter(self.__postings)
 
+    def get_skip_iterator(self) -> Optional[Iterator[Posting]]:
+        return __class__.InMemoryPostingListIterator(self.__postings, self.__skips, self.__step)
+
     def append_posting(self, posting: Posting) -> None:
         assert len(self.__postings) == 0 or self.__postings[-1].document_id < posting.document_id
         self.__postings.append(posting)
 
+    def append_postings(self, postings: Iterable[Posting]) -> None:
+        start = max(0, len(self.__postings) - 1)
+        self.__postings.extend(postings)
+        assert all(p.document_id < q.document_id for (p, q) in zip(self.__postings[start:], self.__postings[start + 1:]))
+
     def finalize_postings(self) -> None:
-        pass
+        self.__step = max(1, isqrt(len(self.__postings)))
+        self.__skips = [posting.document_id for posting in self.__postings[::self.__step]]
 
 
 class CompressedInMemoryPostingList(PostingList):
@@ -1,8 +1,9 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
-from typing import Iterator
+from typing import Callable, Iterator, Optional, Tuple, Union
 from .posting import Posting
+from .postinglist import PostingList
 
 
 class PostingsMerger:
@@ -14,21 +15,43 @@ class PostingsMerger:
     approaches are possible, e.g., an arbitrary one of the two postings could
     be returned, or the posting having the smallest/largest term frequency, or
     a new one that produces an averaged value, or something else.
+
+    The postings to merge can be supplied either as iterators or as posting
+    lists. The latter allows us to make use of skipping, if supported.
     """
 
+    # Only skip through a posting list if it's at least this many times longer than the other one.
+    __SKIPPING_RATIO = 8
+
     @staticmethod
-    def intersection(p1: Iterator[Posting], p2: Iterator[Posting]) -> Iterator[Posting]:
+    def intersection(p1: Union[Iterator[Posting], PostingList],
+                     p2: Union[Iterator[Posting], PostingList]) -> Iterator[Posting]:
         """
         A generator that yields a simple AND of two posting lists, given
         iterators over these.
 
         The posting lists are assumed sorted in increasing order according
         to the document identifiers.
+
+        If both are supplied as posting lists and one of them is much longer
+        than the other one, we skip through the longer one if it supports
+        that. Otherwise we step through both posting lists.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        (p1, skip1), (p2, skip2) = PostingsMerger.__open(p1, p2), PostingsMerger.__open(p2, p1)
+        posting1, posting2 = next(p1, None), next(p2, None)
+        while posting1 is not None and posting2 is not None:
+            document_id1, document_id2 = posting1.document_id, posting2.document_id
+            if document_id1 == document_id2:
+                yield posting1
+                posting1, posting2 = next(p1, None), next(p2, None)
+            elif document_id1 < document_id2:
+                posting1 = skip1(document_id2) if skip1 else next(p1, None)
+            else:
+                posting2 = skip2(document_id1) if skip2 else next(p2, None)
 
     @staticmethod
-    def union(p1: Iterator[Posting], p2: Iterator[Posting]) -> Iterator[Posting]:
+    def union(p1: Union[Iterator[Posting], PostingList],
+              p2: Union[Iterator[Posting], PostingList]) -> Iterator[Posting]:
         """
         A generator that yields a simple OR of two posting lists, given
         iterators over these.
@@ -36,4 +59,37 @@ class PostingsMerger:
         The posting lists are assumed sorted in increasing order according
         to the document identifiers.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        p1, p2 = iter(p1), iter(p2)
+        posting1, posting2 = next(p1, None), next(p2, None)
+        while posting1 is not None and posting2 is not None:
+            document_id1, document_id2 = posting1.document_id, posting2.document_id
+            if document_id1 == document_id2:
+                yield posting1
+                posting1, posting2 = next(p1, None), next(p2, None)
+            elif document_id1 < document_id2:
+                yield posting1
+                posting1 = next(p1, None)
+            else:
+                yield posting2
+                posting2 = next(p2, None)
+        if posting1 is not None:
+            yield posting1
+            yield from p1
+        if posting2 is not None:
+            yield posting2
+            yield from p2
+
+    @staticmethod
+    def __open(p: Union[Iterator[Posting], PostingList],
+               other: Union[Iterator[Posting], PostingList]) -> Tuple[Iterator[Posting], Optional[Callable]]:
+        """
+        Returns an iterator over the given postings. If both the given postings and the other ones are
+        posting lists and ours is much longer, we also return a function for skipping ahead in it, if
+        our posting list supports that. We only skip when both lengths are known.
+        """
+        if isinstance(p, PostingList) and isinstance(other, PostingList):
+            if 0 < other.get_length() and PostingsMerger.__SKIPPING_RATIO * other.get_length() <= p.get_length():
+                iterator = p.get_skip_iterator()
+                if iterator is not None:
+                    return (iterator, iterator.skip_to)
+        return (iter(p), None)
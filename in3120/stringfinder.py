@@ -36,4 +36,20 @@ class StringFinder:
         support for leftmost-longest matching (instead of reporting all matches), and support for lemmatization
         or similar linguistic variations.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        # The (<trie node>, <start offset>, <matched string>) triples for the partial matches that are
+        # still alive after having consumed the previous token. Rebuilt from scratch for every token, so
+        # we never mutate the list we're iterating over and never pay for removing dead states.
+        states = []
+        for (token, (begin, end)) in self.__tokenizer.tokens(buffer):
+            next_states = []
+            candidates = [(node.consume(" "), start, match + " ") for (node, start, match) in states]
+            candidates.append((self.__trie, begin, ""))
+            for (node, start, match) in candidates:
+                node = node.consume(token) if node is not None else None
+                if node is None:
+                    continue
+                match += token
+                if node.is_final():
+                    yield {"match": match, "range": (start, end)}
+                next_states.append((node, start, match))
+            states = next_states
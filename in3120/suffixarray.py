@@ -1,11 +1,17 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+import itertools
+import logging
+from array import array
+from collections import Counter
 from typing import Any, Dict, Iterator, Iterable, Tuple, List
 from .corpus import Corpus
 from .normalizer import Normalizer
 from .tokenizer import Tokenizer
 
+logger = logging.getLogger(__name__)
+
 
 class SuffixArray:
     """
@@ -16,27 +22,133 @@ class SuffixArray:
     to memory usage, and add more lookup/evaluation features.
     """
 
+    # The number of leading characters of each suffix we materialize as its sort key when building.
+    __KEY_LENGTH = 64
+
+    # The number of characters we're always willing to materialize when re-sorting a run of tied sort keys.
+    __MAX_RUN_SIZE = 1 << 20
+
     def __init__(self, corpus: Corpus, fields: Iterable[str], normalizer: Normalizer, tokenizer: Tokenizer):
         self.__corpus = corpus
         self.__normalizer = normalizer
         self.__tokenizer = tokenizer
         self.__haystack: List[Tuple[int, str]] = []  # The (<document identifier>, <searchable content>) pairs.
-        self.__suffixes: List[Tuple[int, int]] = []  # The sorted (<haystack index>, <start offset>) pairs.
+        self.__indices = array("i")  # The <haystack index> part of the sorted suffixes. Parallel to the offsets.
+        self.__offsets = array("i")  # The <start offset> part of the sorted suffixes. Parallel to the indices.
         self.__build_suffix_array(fields)  # Construct the haystack and the suffix array itself.
 
     def __build_suffix_array(self, fields: Iterable[str]) -> None:
         """
         Builds a simple suffix array from the set of named fields in the document collection.
         The suffix array allows us to search across all named fields in one go.
+
+        The suffixes are kept as two parallel arrays of machine integers rather than as a list of
+        (index, offset) tuples. That's 8 bytes per suffix instead of a tuple and two boxed integers.
+
+        We sort by materializing a sort key for each suffix once up front (decorate-sort-undecorate),
+        so that all the comparisons done by the sort are plain string comparisons in C. To keep the
+        memory needed for the keys linear in the number of suffixes, the keys are truncated suffixes.
+        Only the runs of suffixes whose truncated keys tie are then re-sorted, either using their full
+        suffixes, or, if that would be more costly, by ranks that are computed once for all such runs.
+
+        Documents with identical searchable content, e.g., boilerplate or duplicates, share a single
+        string object in the haystack.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        indices = array("i")
+        offsets = array("i")
+        keys: List[str] = []
+        contents: Dict[str, str] = {}
+        fields = tuple(fields)
+        for document in self.__corpus:
+            if len(fields) == 1:
+                text = document.get_field(fields[0], "")
+            else:
+                text = " ".join(document.get_field(field, "") for field in fields)
+            content = self.__normalize(text)
+            content = contents.setdefault(content, content)
+            index = len(self.__haystack)
+            self.__haystack.append((document.document_id, content))
+            for (start, _) in self.__tokenizer.ranges(content):
+                indices.append(index)
+                offsets.append(start)
+                keys.append(content[start:start + self.__KEY_LENGTH])
+        del contents
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        deferred: List[Tuple[int, List[int]]] = []  # The tied runs to sort by rank, and where in the order they are.
+        where = 0
+        for (key, run) in itertools.groupby(order, key=keys.__getitem__):
+            run = list(run)
+            if len(run) > 1 and len(key) == self.__KEY_LENGTH:
+                if self.__is_cheaper_to_rank(run, indices, offsets):
+                    deferred.append((where, run))
+                else:
+                    run.sort(key=lambda i: self.__haystack[indices[i]][1][offsets[i]:])
+                    order[where:where + len(run)] = run
+            where += len(run)
+        del keys
+        if deferred:
+            (ranks, bases) = self.__rank_positions(sorted(set(indices[i] for (_, run) in deferred for i in run)))
+            for (where, run) in deferred:
+                order[where:where + len(run)] = sorted(run, key=lambda i: ranks[bases[indices[i]] + offsets[i]])
+        self.__indices = array("i", (indices[i] for i in order))
+        self.__offsets = array("i", (offsets[i] for i in order))
+
+    def __is_cheaper_to_rank(self, run: List[int], indices: array, offsets: array) -> bool:
+        """
+        Decides how to sort a run of suffixes whose truncated sort keys tie. Usually we just materialize
+        the full suffixes and use those as keys. But for highly repetitive documents the full suffixes
+        can take space quadratic in the document length. Ranking every position in the involved documents
+        by prefix doubling instead costs about one truncated sort key per character of these documents.
+        """
+        size = sum(len(self.__haystack[indices[i]][1]) - offsets[i] for i in run)
+        if size <= self.__MAX_RUN_SIZE:
+            return False
+        involved = sum(len(self.__haystack[index][1]) for index in set(indices[i] for i in run))
+        return self.__KEY_LENGTH * involved < size
+
+    def __rank_positions(self, haystack_indices: List[int]) -> Tuple[List[int], Dict[int, int]]:
+        """
+        Ranks all positions in the given haystack entries so that the ranks of two positions
+        compare the same way as the suffixes starting there do. The positions of the entries are
+        laid out back to back, and the position of a suffix is its offset plus the base of its entry.
+        Returns a pair comprised of the ranks and the bases. This is the classic prefix doubling
+        construction by Manber and Myers, just with a comparison sort instead of radix sorting.
+        """
+        bases: Dict[int, int] = {}
+        keys: List[str] = []
+        ends: List[int] = []
+        for index in haystack_indices:
+            content = self.__haystack[index][1]
+            bases[index] = len(keys)
+            keys.extend(content[p:p + self.__KEY_LENGTH] for p in range(len(content)))
+            ends.extend(itertools.repeat(len(keys), len(content)))
+        n = len(keys)
+        ranks = [0] * n
+        longest = max(len(self.__haystack[index][1]) for index in haystack_indices)
+        pairs: List[Any] = keys  # Initially, rank by the first h characters by sorting truncated suffixes.
+        h = self.__KEY_LENGTH
+        while True:
+            order = sorted(range(n), key=pairs.__getitem__)
+            (rank, previous) = (0, None)
+            for p in order:
+                if pairs[p] != previous:
+                    (rank, previous) = (rank + 1, pairs[p])
+                ranks[p] = rank
+            if rank == n or h >= longest:
+                break
+            # Ranks by the first 2h characters follow from the ranks by the first h characters. A
+            # suffix shorter than h + 1 characters gets a zero as its second half, i.e., sorts first.
+            pairs = [(ranks[p] << 32) | (ranks[p + h] if p + h < ends[p] else 0) for p in range(n)]
+            h *= 2
+        return (ranks, bases)
 
     def __normalize(self, buffer: str) -> str:
         """
         Produces a normalized version of the given string. Both queries and documents need to be
         identically processed for lookups to succeed.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        canonicalized = self.__normalizer.canonicalize(buffer)
+        return " ".join(self.__normalizer.normalize_stream(self.__tokenizer.strings(canonicalized)))
 
     def __binary_search(self, needle: str) -> int:
         """
@@ -45,10 +157,40 @@ class SuffixArray:
         should have been inserted.
 
         Kind of silly to roll our own binary search instead of using the bisect module, but seems needed
-        prior to Python 3.10 due to how we represent the suffixes via (index, offset) tuples. Version 3.10
-        added support for specifying a key.
+        prior to Python 3.10 due to how we represent the suffixes via parallel (index, offset) arrays. Version
+        3.10 added support for specifying a key, but the key function is then a Python-level call per probe.
+        """
+        # Only the first len(needle) characters of a suffix can affect how it compares to the needle,
+        # so we avoid slicing out the full suffix at every probe.
+        # Bind everything the loop touches to locals, so that each probe avoids attribute lookups.
+        haystack, indices, offsets, length = self.__haystack, self.__indices, self.__offsets, len(needle)
+        left, right = 0, len(offsets)
+        while left < right:
+            middle = (left + right) // 2
+            offset = offsets[middle]
+            if haystack[indices[middle]][1][offset:offset + length] < needle:
+                left = middle + 1
+            else:
+                right = middle
+        return left
+
+    def __binary_search_upper(self, needle: str, begin: int) -> int:
+        """
+        Does a binary search for the first position in the suffix array where the suffix is greater than,
+        and does not start with, the given normalized query. Together with the position returned by
+        __binary_search, this delimits the range of suffixes that start with the query. The search
+        starts from the given position, which should be the one returned by __binary_search.
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
+        haystack, indices, offsets, length = self.__haystack, self.__indices, self.__offsets, len(needle)
+        left, right = begin, len(offsets)
+        while left < right:
+            middle = (left + right) // 2
+            offset = offsets[middle]
+            if haystack[indices[middle]][1][offset:offset + length] > needle:
+                right = middle
+            else:
+                left = middle + 1
+        return left
 
     def evaluate(self, query: str, options: dict) -> Iterator[Dict[str, Any]]:
         """
@@ -61,9 +203,21 @@ class SuffixArray:
         and only the "best" matches are yielded back to the client. Ties are resolved arbitrarily.
 
         The client can supply a dictionary of options that controls this query evaluation process: The maximum
-        number of documents to return to the client is controlled via the "hit_count" (int) option.
+        number of documents to return to the client is controlled via the "hit_count" (int) option. If the
+        "debug" (bool) option is set, details about the lookup are logged at the debug level.
 
         The results yielded back to the client are dictionaries having the keys "score" (int) and
         "document" (Document).
         """
-        raise NotImplementedError("You need to implement this as part of the assignment.")
\ No newline at end of file
+        needle = self.__normalize(query)
+        if not needle:
+            return
+        begin = self.__binary_search(needle)
+        end = self.__binary_search_upper(needle, begin)
+        if options.get("debug", False):
+            logger.debug("Searching for %r, matching suffixes are in range [%d, %d)", needle, begin, end)
+        # Each document has exactly one haystack entry, so we can count the haystack indices of the matching
+        # suffixes directly, and only look up the document identifiers of the winners.
+        counts = Counter(self.__indices[begin:end])
+        for (index, score) in counts.most_common(min(100, max(1, int(options.get("hit_count", 5))))):
+            yield {"score": score, "document": self.__corpus[self.__haystack[index][0]]}
@@ -60,4 +60,9 @@ class SimpleTokenizer(Tokenizer):
         pass
 
     def ranges(self, buffer: str) -> Iterator[Tuple[int, int]]:
-        return ((m.start(), m.end()) for m in self.__pattern.finditer(buffer))
+        return (m.span() for m in self.__pattern.finditer(buffer))
+
+    def strings(self, buffer: str) -> Iterator[str]:
+        # Let the regular expression engine extract all the token strings in one sweep, instead of
+        # creating match objects and range pairs that we'd only use for slicing out the strings.
+        yield from self.__pattern.findall(buffer)
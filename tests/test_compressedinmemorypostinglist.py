@@ -21,6 +21,14 @@ class TestCompressedInMemoryPostingList(unittest.TestCase):
     def test_invalid_append(self):
         self._tester1._test_invalid_append(in3120.CompressedInMemoryPostingList())
 
+    def test_append_after_finalize(self):
+        postings = in3120.CompressedInMemoryPostingList()
+        postings.append_posting(in3120.Posting(1, 1))
+        postings.finalize_postings()
+        postings.append_posting(in3120.Posting(5, 3))
+        postings.finalize_postings()
+        self.assertListEqual([(p.document_id, p.term_frequency) for p in postings], [(1, 1), (5, 3)])
+
     def test_mesh_corpus(self):
         self._tester2._test_mesh_corpus(True)
 
@@ -22,6 +22,9 @@ class TestInMemoryInvertedIndexWithCompression(unittest.TestCase):
     def test_multiple_fields(self):
         self._tester.test_multiple_fields()
 
+    def test_multiple_workers(self):
+        self._tester.test_multiple_workers()
+
     def test_memory_usage(self):
         import tracemalloc
         import inspect
@@ -31,6 +31,15 @@ class TestInMemoryInvertedIndexWithoutCompression(unittest.TestCase):
         self.assertEqual(len(list(index["hydrogen"])), 8)
         self.assertEqual(len(list(index["hydrocephalus"])), 2)
 
+    def test_multiple_workers(self):
+        corpus = in3120.InMemoryCorpus("../data/mesh.txt")
+        for normalizer in [self._normalizer, in3120.PorterNormalizer(), in3120.SoundexNormalizer()]:
+            index1 = in3120.InMemoryInvertedIndex(corpus, ["body"], normalizer, self._tokenizer, self._compressed)
+            index2 = in3120.InMemoryInvertedIndex(corpus, ["body"], normalizer, self._tokenizer, self._compressed, 2)
+            for term in index1.get_terms("hydrogen hydrocephalus water toxic wtf"):
+                self.assertListEqual([(p.document_id, p.term_frequency) for p in index1[term]],
+                                     [(p.document_id, p.term_frequency) for p in index2[term]])
+
     def test_multiple_fields(self):
         document = in3120.InMemoryDocument(0, {
             'felt1': 'Dette er en test. Test, sa jeg. TEST!',
@@ -42,6 +42,33 @@ class TestInMemoryPostingList(unittest.TestCase):
             with self.assertRaises(AssertionError):
                 postings.append_posting(in3120.Posting(21 - i, 2))
 
+    def test_skip_to(self):
+        postings = in3120.InMemoryPostingList()
+        for document_id in range(0, 200, 2):
+            postings.append_posting(in3120.Posting(document_id, 1))
+        postings.finalize_postings()
+        iterator = postings.get_skip_iterator()
+        self.assertEqual(iterator.skip_to(0).document_id, 0)
+        self.assertEqual(iterator.skip_to(41).document_id, 42)
+        self.assertEqual(next(iterator).document_id, 44)
+        self.assertEqual(iterator.skip_to(10).document_id, 46)
+        self.assertEqual(iterator.skip_to(198).document_id, 198)
+        self.assertIsNone(iterator.skip_to(199))
+        self.assertIsNone(next(iterator, None))
+
+    def test_skip_iterator_length_hint(self):
+        import operator
+        postings = in3120.InMemoryPostingList()
+        for document_id in range(0, 10):
+            postings.append_posting(in3120.Posting(document_id, 1))
+        postings.finalize_postings()
+        iterator = postings.get_skip_iterator()
+        self.assertEqual(operator.length_hint(iterator), 10)
+        self.assertEqual(iterator.skip_to(6).document_id, 6)
+        self.assertEqual(operator.length_hint(iterator), 3)
+        self.assertListEqual([posting.document_id for posting in iterator], [7, 8, 9])
+        self.assertEqual(operator.length_hint(iterator), 0)
+
     def test_append_and_iterate(self):
         self._test_append_and_iterate(in3120.InMemoryPostingList())
 
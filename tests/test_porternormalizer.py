@@ -23,6 +23,13 @@ class TestPorterNormalizer(unittest.TestCase):
         self.assertEqual(self.__normalizer.normalize("eed"), "eed")
         self.assertEqual(self.__normalizer.normalize("oed"), "o")
 
+    def test_normalize_repeated_inputs(self):
+        for _ in range(0, 2):
+            self.assertEqual(self.__normalizer.normalize("visible"), "visibl")
+            self.assertEqual(self.__normalizer.normalize("VISIBLE"), "visibl")
+            with self.assertRaises(ValueError):
+                self.__normalizer.normalize("")
+
     def test_normalize_exceptions(self):
         self.assertEqual(self.__normalizer.normalize("inning"), "inning")
         self.assertEqual(self.__normalizer.normalize("innings"), "inning")
@@ -33,6 +33,25 @@ class TestPostingsMerger(unittest.TestCase):
         self.assertListEqual(result12, [1, 2, 3, 6])
         self.assertListEqual(result12, result21)
 
+    def test_asymmetric_lists(self):
+        postings1 = in3120.InMemoryPostingList()
+        postings2 = in3120.InMemoryPostingList()
+        for document_id in [3, 500, 501, 998, 2000]:
+            postings1.append_posting(in3120.Posting(document_id, 1))
+        for document_id in range(0, 1000):
+            postings2.append_posting(in3120.Posting(document_id, 2))
+        postings1.finalize_postings()
+        postings2.finalize_postings()
+        for (p1, p2) in [(postings1, postings2), (iter(postings1), postings2), (postings1, iter(postings2))]:
+            result = [(p.document_id, p.term_frequency) for p in self._merger.intersection(p1, p2)]
+            self.assertListEqual(result, [(3, 1), (500, 1), (501, 1), (998, 1)])
+        for (p1, p2) in [(postings2, postings1), (iter(postings2), postings1), (postings2, iter(postings1))]:
+            result = [(p.document_id, p.term_frequency) for p in self._merger.intersection(p1, p2)]
+            self.assertListEqual(result, [(3, 2), (500, 2), (501, 2), (998, 2)])
+        nested = self._merger.union(iter(postings1), iter([]))
+        result = [p.document_id for p in self._merger.intersection(postings2, nested)]
+        self.assertListEqual(result, [3, 500, 501, 998])
+
     def test_uses_yield(self):
         import types
         postings1 = [in3120.Posting(1, 0), in3120.Posting(2, 0), in3120.Posting(3, 0)]
@@ -25,6 +25,12 @@ class TestSimpleNormalizer(unittest.TestCase):
     def test_normalize(self):
         self.assertEqual(self.__normalizer.normalize("grÅFustaSJE"), "gråfustasje")
 
+    def test_normalize_stream(self):
+        tokens = ["grÅFustaSJE", "PRøvE", "Straße"]
+        self.assertListEqual(list(self.__normalizer.normalize_stream(tokens)), ["gråfustasje", "prøve", "strasse"])
+        self.assertListEqual(list(self.__normalizer.normalize_stream(tokens)),
+                             [self.__normalizer.normalize(token) for token in tokens])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -7,9 +7,10 @@ from context import in3120
 
 class TestSuffixArray(unittest.TestCase):
 
-    def setUp(self):
-        self.__normalizer = in3120.SimpleNormalizer()
-        self.__tokenizer = in3120.SimpleTokenizer()
+    @classmethod
+    def setUpClass(cls):
+        cls.__normalizer = in3120.SimpleNormalizer()
+        cls.__tokenizer = in3120.SimpleTokenizer()
 
     def __process_query_and_verify_winner(self, engine, query, winners, score):
         options = {"debug": False, "hit_count": 5}
@@ -39,6 +40,36 @@ class TestSuffixArray(unittest.TestCase):
         self.__process_query_and_verify_winner(engine, "", [], None)
         self.__process_query_and_verify_winner(engine, "approximate solution", [159, 1374], 3)
 
+    def test_duplicate_documents(self):
+        corpus = in3120.InMemoryCorpus()
+        corpus.add_document(in3120.InMemoryDocument(0, {"a": "Hello world"}))
+        corpus.add_document(in3120.InMemoryDocument(1, {"a": "hello there"}))
+        corpus.add_document(in3120.InMemoryDocument(2, {"a": "HELLO  WORLD"}))
+        engine = in3120.SuffixArray(corpus, ["a"], self.__normalizer, self.__tokenizer)
+        matches = list(engine.evaluate("hello wor", {}))
+        self.assertListEqual(sorted(m["document"].document_id for m in matches), [0, 2])
+        self.assertListEqual([m["score"] for m in matches], [1, 1])
+        self.assertIs(engine._SuffixArray__haystack[0][1], engine._SuffixArray__haystack[2][1])
+
+    def test_shared_prefix(self):
+        import random
+        import tracemalloc
+        rng = random.Random(210470)
+        words = ["".join(rng.choice("abcdefghij") for _ in range(rng.randint(3, 8))) for _ in range(5000)]
+        header = "Copyright notice: This document is part of the collection, all rights reserved by the publishers."
+        corpus = in3120.InMemoryCorpus()
+        for document_id in range(0, 600):
+            body = " ".join(rng.choice(words) for _ in range(300))
+            corpus.add_document(in3120.InMemoryDocument(document_id, {"a": header + " " + body}))
+        tracemalloc.start()
+        engine = in3120.SuffixArray(corpus, ["a"], self.__normalizer, self.__tokenizer)
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLessEqual(peak, 64000000, "Memory usage seems excessive.")
+        self.__process_query_and_verify_winner(engine, "rights reserved", list(range(0, 600)), 1)
+        suffix = corpus[42].get_field("a", "")[len(header) - len("publishers."):][:60]
+        self.__process_query_and_verify_winner(engine, suffix, [42], 1)
+
     def test_memory_usage(self):
         import tracemalloc
         import inspect